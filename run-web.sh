@@ -1,4 +1,4 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-uvicorn web:app --host 0.0.0.0 --port 7932 "$@"
+uvicorn --factory web:create_app --host 0.0.0.0 --port 7932 "$@"
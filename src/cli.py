@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import sys
-import logfire
-from pydantic_ai.messages import ModelMessage
+from typing import TYPE_CHECKING
 
 from config import load_config
-from training_agent import create_agent
 
-logfire.configure()
-logfire.instrument_pydantic_ai()
+if TYPE_CHECKING:
+    from pydantic_ai.messages import ModelMessage
 
 
 def _print_assistant(message: str | None) -> None:
@@ -23,6 +21,16 @@ def main() -> int:
         print(f"Configuration error: {exc}", file=sys.stderr)
         return 1
 
+    # Deferred so that configuration errors are reported without paying for
+    # the agent and instrumentation imports.
+    import logfire
+
+    from prompt_cache import record_cache_usage
+    from training_agent import create_agent
+
+    logfire.configure()
+    logfire.instrument_pydantic_ai()
+
     agent = create_agent(config)
     message_history: list[ModelMessage] = []
 
@@ -46,6 +54,7 @@ def main() -> int:
             continue
 
         message_history = result.all_messages()
+        record_cache_usage("chat", result.usage())
         _print_assistant(result.output)
 
     return 0
@@ -15,8 +15,10 @@ class Config:
     mcp_basic_auth_password: str | None
     signal_api_url: str | None
     signal_number: str | None
+    signal_recipients: tuple[str, ...]
     signal_basic_auth_username: str | None
     signal_basic_auth_password: str | None
+    summary_schedules: str | None
 
     def mcp_headers(self) -> dict[str, str] | None:
         return _basic_auth_header(self.mcp_basic_auth_username, self.mcp_basic_auth_password)
@@ -54,6 +56,12 @@ def load_config() -> Config:
         mcp_basic_auth_password=os.getenv("MCP_BASIC_AUTH_PASSWORD", "").strip() or None,
         signal_api_url=os.getenv("SIGNAL_API_URL", "").strip() or None,
         signal_number=os.getenv("SIGNAL_NUMBER", "").strip() or None,
+        signal_recipients=tuple(
+            recipient.strip()
+            for recipient in os.getenv("SIGNAL_RECIPIENTS", "").split(",")
+            if recipient.strip()
+        ),
         signal_basic_auth_username=os.getenv("SIGNAL_BASIC_AUTH_USERNAME", "").strip() or None,
         signal_basic_auth_password=os.getenv("SIGNAL_BASIC_AUTH_PASSWORD", "").strip() or None,
+        summary_schedules=os.getenv("SUMMARY_SCHEDULES", "").strip() or None,
     )
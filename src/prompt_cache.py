@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import logfire
+
+if TYPE_CHECKING:
+    from pydantic_ai.settings import ModelSettings
+    from pydantic_ai.usage import RunUsage
+
+LOGGER = logging.getLogger(__name__)
+
+
+def prompt_cache_settings(model: str, cache_key: str, *, cache_messages: bool = False) -> ModelSettings | None:
+    """Return model settings that opt into the provider's prompt caching, if it has any.
+
+    Only the static prefix (tool definitions and instructions) is marked for caching unless
+    ``cache_messages`` is set, which also caches the message history of a conversation.
+    """
+    provider = model.split(":", 1)[0]
+    if provider.startswith("openai"):
+        return {"openai_prompt_cache_key": cache_key}
+    if provider.startswith("anthropic"):
+        return {
+            "anthropic_cache_tool_definitions": True,
+            "anthropic_cache_instructions": True,
+            "anthropic_cache_messages": cache_messages,
+        }
+    return None
+
+
+def record_cache_usage(name: str, usage: RunUsage) -> float | None:
+    if not usage.input_tokens:
+        return None
+    ratio = usage.cache_read_tokens / usage.input_tokens
+    LOGGER.info(
+        "%s.prompt_cache input_tokens=%d cache_read_tokens=%d cache_write_tokens=%d ratio=%.3f",
+        name,
+        usage.input_tokens,
+        usage.cache_read_tokens,
+        usage.cache_write_tokens,
+        ratio,
+    )
+    logfire.info(
+        "{name}.prompt_cache ratio={ratio}",
+        name=name,
+        ratio=round(ratio, 3),
+        input_tokens=usage.input_tokens,
+        cache_read_tokens=usage.cache_read_tokens,
+        cache_write_tokens=usage.cache_write_tokens,
+    )
+    return ratio
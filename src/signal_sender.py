@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import Optional, Protocol
+import logging
+import re
+import time
+from typing import Optional, Protocol, Sequence
 
 import httpx
 
 from config import Config
 
+LOGGER = logging.getLogger(__name__)
+_FAILED_RECIPIENT_PATTERN = re.compile(r"Failed to send message to (\S+?): .+")
+
 
 class SignalSendError(RuntimeError):
     pass
@@ -17,10 +24,49 @@ class SignalSendResult:
     timestamp: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class SignalMessage:
+    message: str
+    recipients: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SignalRecipientResult:
+    recipient: str
+    timestamp: Optional[str] = None
+    error: Optional[str] = None
+
+
 class SignalSender(Protocol):
+    @property
+    def recipients(self) -> tuple[str, ...]:
+        ...
+
     async def send(self, message: str) -> SignalSendResult:
         ...
 
+    async def send_many(self, messages: Sequence[SignalMessage]) -> list[SignalRecipientResult]:
+        ...
+
+
+class _RateLimiter:
+    """Spaces request starts at least ``1 / requests_per_second`` apart."""
+
+    def __init__(self, requests_per_second: float | None):
+        self._interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 class SignalSenderHttp:
     def __init__(
@@ -29,32 +75,127 @@ class SignalSenderHttp:
         number: str,
         timeout: float = 30.0,
         headers: dict[str, str] | None = None,
+        recipients: Sequence[str] | None = None,
+        max_concurrency: int = 4,
+        max_recipients_per_request: int = 10,
+        requests_per_second: float | None = 2.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self._api_url = api_url.rstrip("/")
         self._number = number
         self._timeout = timeout
         self._headers = headers
+        self._recipients = tuple(recipients) if recipients else (number,)
+        self._max_concurrency = max_concurrency
+        self._max_recipients_per_request = max_recipients_per_request
+        self._rate_limiter = _RateLimiter(requests_per_second)
+        self._transport = transport
+
+    @property
+    def recipients(self) -> tuple[str, ...]:
+        return self._recipients
 
     async def send(self, message: str) -> SignalSendResult:
+        results = await self.send_many([SignalMessage(message, self._recipients)])
+        delivered = [result for result in results if result.error is None]
+        if not delivered:
+            raise SignalSendError(results[0].error or "Signal API request failed")
+
+        failed = [result.recipient for result in results if result.error is not None]
+        if failed:
+            LOGGER.warning("signal.partial_failure failed=%d delivered=%d", len(failed), len(delivered))
+        # Recipients delivered as part of a partially failed batch have no timestamp,
+        # so prefer one that came with a 201 response.
+        timestamps = [result.timestamp for result in delivered if result.timestamp is not None]
+        return SignalSendResult(timestamp=timestamps[0] if timestamps else None)
+
+    async def send_many(self, messages: Sequence[SignalMessage]) -> list[SignalRecipientResult]:
+        """Send each message to its recipients concurrently.
+
+        Recipients of a message are batched into multi-recipient requests. When signal-cli
+        reports failures per recipient ("Failed to send message to ..."), it has already
+        delivered to the rest of the batch, so only the reported recipients are retried. Any
+        other error fails the whole batch. Timeouts and server errors
+        leave the outcome unknown and are never re-sent to the whole batch.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        batch_size = self._max_recipients_per_request
+        batches = [
+            (signal_message.message, signal_message.recipients[start:start + batch_size])
+            for signal_message in messages
+            for start in range(0, len(signal_message.recipients), batch_size)
+        ]
+
+        async with httpx.AsyncClient(
+            timeout=self._timeout,
+            headers=self._headers,
+            transport=self._transport,
+        ) as client:
+            batch_results = await asyncio.gather(
+                *(self._send_batch(client, semaphore, message, recipients) for message, recipients in batches)
+            )
+
+        return [result for results in batch_results for result in results]
+
+    async def _send_batch(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        message: str,
+        recipients: Sequence[str],
+    ) -> list[SignalRecipientResult]:
+        try:
+            response = await self._post(client, semaphore, message, recipients)
+        except SignalSendError as exc:
+            return [SignalRecipientResult(recipient, error=str(exc)) for recipient in recipients]
+
+        if response.status_code == 201:
+            timestamp = _extract_timestamp(response)
+            return [SignalRecipientResult(recipient, timestamp=timestamp) for recipient in recipients]
+
+        error = f"Signal API returned HTTP {response.status_code}"
+        failed = set()
+        if len(recipients) > 1 and 400 <= response.status_code < 500:
+            failed = _failed_recipients(response, recipients)
+        if not failed:
+            return [SignalRecipientResult(recipient, error=error) for recipient in recipients]
+
+        retried = await asyncio.gather(
+            *(
+                self._send_batch(client, semaphore, message, [recipient])
+                for recipient in recipients
+                if recipient in failed
+            )
+        )
+        retried_results = {result.recipient: result for results in retried for result in results}
+        return [retried_results.get(recipient, SignalRecipientResult(recipient)) for recipient in recipients]
+
+    async def _post(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        message: str,
+        recipients: Sequence[str],
+    ) -> httpx.Response:
         payload = {
             "message": message,
             "number": self._number,
-            "recipients": [self._number],
+            "recipients": list(recipients),
         }
         url = f"{self._api_url}/v2/send"
 
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout, headers=self._headers) as client:
+        async with semaphore:
+            try:
+                await self._rate_limiter.wait()
                 response = await client.post(url, json=payload)
-                if 500 <= response.status_code < 600:
+                # A server error may come after delivery, so only a single recipient is retried.
+                if 500 <= response.status_code < 600 and len(recipients) == 1:
+                    await self._rate_limiter.wait()
                     response = await client.post(url, json=payload)
-        except httpx.RequestError as exc:
-            raise SignalSendError("Signal API request failed") from exc
+            except httpx.RequestError as exc:
+                raise SignalSendError("Signal API request failed") from exc
 
-        if response.status_code != 201:
-            raise SignalSendError(f"Signal API returned HTTP {response.status_code}")
-
-        return SignalSendResult(timestamp=_extract_timestamp(response))
+        return response
 
 
 def build_signal_sender(config: Config) -> SignalSender | None:
@@ -64,9 +205,30 @@ def build_signal_sender(config: Config) -> SignalSender | None:
         config.signal_api_url,
         config.signal_number,
         headers=config.signal_headers(),
+        recipients=config.signal_recipients,
     )
 
 
+def _failed_recipients(response: httpx.Response, recipients: Sequence[str]) -> set[str]:
+    """Return the recipients signal-cli reported as failed, or nothing if it did not report per recipient."""
+    try:
+        data = response.json()
+    except ValueError:
+        return set()
+    error = data.get("error") if isinstance(data, dict) else None
+    if not isinstance(error, str):
+        return set()
+
+    lines = [line.strip() for line in error.splitlines() if line.strip()]
+    matches = [_FAILED_RECIPIENT_PATTERN.fullmatch(line) for line in lines]
+    if not lines or not all(matches):
+        return set()
+    failed = {match.group(1) for match in matches}
+    if not failed.issubset(recipients):
+        return set()
+    return failed
+
+
 def _extract_timestamp(response: httpx.Response) -> Optional[str]:
     try:
         data = response.json()
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import os
 
-from pydantic_ai import Agent, RunContext
+from pydantic_ai import Agent
 from pydantic_ai.mcp import MCPServerStreamableHTTP
 
 from config import Config
+from prompt_cache import prompt_cache_settings
 
 DEFAULT_BASE_INSTRUCTIONS = (
     "You are a training assistant. You can access the user's training data through MCP tools. "
@@ -20,6 +21,7 @@ class Summary:
     activity_end_date: str
     fitness_start_date: str
     fitness_end_date: str
+    athlete_id: str | None = None
 
 
 def create_summary_agent(config: Config) -> Agent[Summary, str]:
@@ -28,20 +30,25 @@ def create_summary_agent(config: Config) -> Agent[Summary, str]:
         headers=config.mcp_headers(),
     )
     base_instructions = os.getenv("BASE_INSTRUCTIONS", DEFAULT_BASE_INSTRUCTIONS)
-    agent = Agent[Summary, str](
+    return Agent[Summary, str](
         config.model,
         deps_type=Summary,
         instructions=base_instructions,
         toolsets=[mcp_server],
+        model_settings=prompt_cache_settings(config.model, "training-ai-summary"),
     )
 
-    @agent.instructions
-    def date_range_instructions(ctx: RunContext[Summary]) -> str:
-        return (
-            "Use activity data from date "
-            f"{ctx.deps.activity_start_date} to {ctx.deps.activity_end_date}. "
-            "Use fitness data from "
-            f"{ctx.deps.fitness_start_date} to {ctx.deps.fitness_end_date}."
-        )
 
-    return agent
+def build_summary_prompt(user_message: str, summary: Summary) -> str:
+    # The date ranges and athlete change between runs, so they go last to keep the cached
+    # prefix (tool definitions, instructions and user message) identical between runs.
+    prompt = (
+        f"{user_message}\n\n"
+        "Use activity data from date "
+        f"{summary.activity_start_date} to {summary.activity_end_date}. "
+        "Use fitness data from "
+        f"{summary.fitness_start_date} to {summary.fitness_end_date}."
+    )
+    if summary.athlete_id:
+        prompt += f" Use athlete ID {summary.athlete_id} in all data requests."
+    return prompt
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import logging
 import time
 import uuid
@@ -18,7 +18,8 @@ from starlette.status import (
 )
 import os
 
-from summary_agent import Summary
+from prompt_cache import record_cache_usage
+from summary_agent import Summary, build_summary_prompt
 from signal_sender import SignalSendError, SignalSender
 
 DEFAULT_USER_MESSAGE = "Summarize my activity and fitness development."
@@ -30,6 +31,8 @@ class SummaryRequest(BaseModel):
     fitness_days: int = Field(..., ge=1, le=30)
     send_signal: bool = False
     timezone: str
+    athlete_id: Optional[str] = Field(None, min_length=1)
+    refresh: bool = False
 
     @field_validator("timezone")
     @classmethod
@@ -63,9 +66,9 @@ def _format_validation_error(error: ValidationError) -> str:
     return message
 
 
-def _compute_date_range(days: int, timezone: str) -> DateRange:
-    tz = ZoneInfo(timezone)
-    today = datetime.now(tz).date()
+def _compute_date_range(days: int, timezone: str, today: date | None = None) -> DateRange:
+    if today is None:
+        today = datetime.now(ZoneInfo(timezone)).date()
     end_date = today - timedelta(days=1)
     start_date = end_date - timedelta(days=days - 1)
     return DateRange(start=start_date.isoformat(), end=end_date.isoformat())
@@ -76,6 +79,31 @@ class SummaryAgent(Protocol):
         ...
 
 
+class SummaryStore:
+    """Keeps precomputed summaries keyed by athlete and date ranges until they expire."""
+
+    def __init__(self, max_entries: int = 32, max_age: timedelta = timedelta(hours=6)):
+        self._max_entries = max_entries
+        self._max_age_s = max_age.total_seconds()
+        self._summaries: dict[Summary, tuple[str, float]] = {}
+
+    def get(self, deps: Summary) -> str | None:
+        entry = self._summaries.get(deps)
+        if entry is None:
+            return None
+        summary, stored_at = entry
+        if time.monotonic() - stored_at >= self._max_age_s:
+            del self._summaries[deps]
+            return None
+        return summary
+
+    def put(self, deps: Summary, summary: str) -> None:
+        self._summaries.pop(deps, None)
+        self._summaries[deps] = (summary, time.monotonic())
+        while len(self._summaries) > self._max_entries:
+            del self._summaries[next(iter(self._summaries))]
+
+
 def _error_response(code: str, message: str, status_code: int) -> JSONResponse:
     return JSONResponse({"code": code, "message": message}, status_code=status_code)
 
@@ -102,14 +130,19 @@ def _validate_summary_request(payload: dict, request_id: str) -> SummaryRequest
         )
 
 
-def _build_summary_deps(summary_request: SummaryRequest) -> tuple[DateRange, DateRange, Summary]:
+def build_summary_deps(
+        summary_request: SummaryRequest,
+        today: date | None = None,
+) -> tuple[DateRange, DateRange, Summary]:
     activity_range = _compute_date_range(
         summary_request.activity_days,
         summary_request.timezone,
+        today,
     )
     fitness_range = _compute_date_range(
         summary_request.fitness_days,
         summary_request.timezone,
+        today,
     )
 
     deps = Summary(
@@ -117,12 +150,13 @@ def _build_summary_deps(summary_request: SummaryRequest) -> tuple[DateRange, Dat
         activity_end_date=activity_range.end,
         fitness_start_date=fitness_range.start,
         fitness_end_date=fitness_range.end,
+        athlete_id=summary_request.athlete_id,
     )
 
     return activity_range, fitness_range, deps
 
 
-async def _generate_summary(
+async def generate_summary(
         agent: SummaryAgent,
         deps: Summary,
         request_id: str,
@@ -134,7 +168,7 @@ async def _generate_summary(
             fitness_start=deps.fitness_start_date, fitness_end=deps.fitness_end_date):
         try:
             user_message = os.getenv("SUMMARY_USER_MESSAGE", DEFAULT_USER_MESSAGE)
-            result = await agent.run(user_message, deps=deps)
+            result = await agent.run(build_summary_prompt(user_message, deps), deps=deps)
         except Exception:
             LOGGER.exception("summary.failed request_id=%s", request_id)
             logfire.exception("summary.failed")
@@ -145,10 +179,11 @@ async def _generate_summary(
             )
     summary_elapsed = time.monotonic() - summary_start
     LOGGER.info("summary.completed request_id=%s elapsed_s=%.3f", request_id, summary_elapsed)
+    record_cache_usage("summary", result.usage())
     return result.output, None
 
 
-async def _send_signal(
+async def send_signal(
         signal_sender: SignalSender,
         message: str,
         request_id: str,
@@ -178,6 +213,7 @@ async def _send_signal(
 def create_summary_handler(
         agent: SummaryAgent,
         signal_sender: SignalSender | None = None,
+        summary_store: SummaryStore | None = None,
 ):
     async def summary_handler(request: Request) -> JSONResponse:
         request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
@@ -190,11 +226,12 @@ def create_summary_handler(
             if isinstance(summary_request, JSONResponse):
                 return summary_request
 
-            activity_range, fitness_range, deps = _build_summary_deps(summary_request)
+            activity_range, fitness_range, deps = build_summary_deps(summary_request)
 
             LOGGER.info(
-                "summary.requested request_id=%s activity_range=%s..%s fitness_range=%s..%s",
+                "summary.requested request_id=%s athlete_id=%s activity_range=%s..%s fitness_range=%s..%s",
                 request_id,
+                summary_request.athlete_id,
                 activity_range.start,
                 activity_range.end,
                 fitness_range.start,
@@ -210,17 +247,24 @@ def create_summary_handler(
                     HTTP_503_SERVICE_UNAVAILABLE,
                 )
 
-            summary_output, error_response = await _generate_summary(agent, deps, request_id)
-            if error_response:
-                return error_response
-            assert summary_output is not None
+            # Only the scheduler fills the store; ad-hoc results are not cached.
+            summary_output = None
+            if summary_store is not None and not summary_request.refresh:
+                summary_output = summary_store.get(deps)
+            if summary_output is not None:
+                LOGGER.info("summary.precomputed request_id=%s", request_id)
+            else:
+                summary_output, error_response = await generate_summary(agent, deps, request_id)
+                if error_response:
+                    return error_response
+                assert summary_output is not None
 
             signal_timestamp = None
             sent_signal = False
 
             if summary_request.send_signal:
                 assert signal_sender is not None
-                signal_timestamp, error_response = await _send_signal(
+                signal_timestamp, error_response = await send_signal(
                     signal_sender,
                     summary_output,
                     request_id,
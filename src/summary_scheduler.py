@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+import json
+import logging
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import logfire
+from pydantic import Field, TypeAdapter, ValidationError
+
+from summary_agent import Summary
+from summary_api import (
+    SummaryAgent,
+    SummaryRequest,
+    SummaryStore,
+    build_summary_deps,
+    generate_summary,
+)
+from signal_sender import SignalMessage, SignalSender
+
+LOGGER = logging.getLogger(__name__)
+MISSED_DELIVERY_WINDOW = timedelta(hours=1)
+
+
+class SummarySchedule(SummaryRequest):
+    delivery_time: time
+    # Bounded by the store's default max_age so the prepared summary is still there at delivery.
+    prepare_minutes: int = Field(60, ge=0, le=360)
+    recipients: Optional[list[str]] = Field(None, min_length=1)
+
+
+_SCHEDULES_ADAPTER = TypeAdapter(list[SummarySchedule])
+
+
+def load_schedules(raw: str | None) -> list[SummarySchedule]:
+    if not raw:
+        return []
+    try:
+        return _SCHEDULES_ADAPTER.validate_python(json.loads(raw))
+    except (ValueError, ValidationError) as exc:
+        raise RuntimeError(f"Invalid SUMMARY_SCHEDULES: {exc}") from exc
+
+
+def _next_delivery(schedule: SummarySchedule, after: datetime) -> datetime:
+    tz = ZoneInfo(schedule.timezone)
+    local_after = after.astimezone(tz)
+    delivery_at = datetime.combine(local_after.date(), schedule.delivery_time, tzinfo=tz)
+    if delivery_at <= local_after:
+        delivery_at = datetime.combine(
+            local_after.date() + timedelta(days=1),
+            schedule.delivery_time,
+            tzinfo=tz,
+        )
+    return delivery_at
+
+
+def _prepare_at(schedule: SummarySchedule, delivery_at: datetime) -> datetime:
+    # Subtract in UTC: wall-clock arithmetic would be off by an hour on DST-change nights.
+    return delivery_at.astimezone(timezone.utc) - timedelta(minutes=schedule.prepare_minutes)
+
+
+def _scheduled_request_id(schedule: SummarySchedule, delivery_at: datetime) -> str:
+    return f"scheduled-{schedule.athlete_id or 'default'}-{delivery_at.date().isoformat()}"
+
+
+def _log_skipped_delivery(request_id: str, reason: str) -> None:
+    LOGGER.error("summary.delivery_skipped request_id=%s reason=%s", request_id, reason)
+    logfire.error("summary.delivery_skipped {reason}", request_id=request_id, reason=reason)
+
+
+def _warn_if_delivery_missed(schedule: SummarySchedule, now: datetime) -> None:
+    # Deliveries are not persisted, so a restart right after a delivery time may mean the
+    # process was down and that delivery never happened.
+    previous_delivery = _next_delivery(schedule, now - timedelta(days=1))
+    if timedelta(0) <= now - previous_delivery < MISSED_DELIVERY_WINDOW:
+        request_id = _scheduled_request_id(schedule, previous_delivery)
+        LOGGER.warning("summary.delivery_possibly_missed request_id=%s", request_id)
+        logfire.warning("summary.delivery_possibly_missed", request_id=request_id)
+
+
+async def _sleep_until(moment: datetime) -> None:
+    delay = (moment - datetime.now(timezone.utc)).total_seconds()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+class SummaryScheduler:
+    """Builds scheduled summaries ahead of their delivery time.
+
+    Each schedule prepares its summary ``prepare_minutes`` before delivery, stores it for
+    ``/summary`` to reuse and sends it over Signal at the delivery minute. A failed build is
+    retried up to ``prepare_attempts`` times before delivery, and a skipped delivery is
+    logged as an error.
+    """
+
+    def __init__(
+            self,
+            agent: SummaryAgent,
+            schedules: list[SummarySchedule],
+            summary_store: SummaryStore,
+            signal_sender: SignalSender | None = None,
+            prepare_attempts: int = 3,
+            retry_delay: timedelta = timedelta(minutes=10),
+    ):
+        self._agent = agent
+        self._schedules = schedules
+        self._summary_store = summary_store
+        self._signal_sender = signal_sender
+        self._prepare_attempts = prepare_attempts
+        self._retry_delay = retry_delay
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        for schedule in self._schedules:
+            self._tasks.append(asyncio.create_task(self._run_schedule(schedule)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def prepare(self, schedule: SummarySchedule, delivery_at: datetime) -> Summary:
+        _, _, deps = build_summary_deps(schedule, delivery_at.date())
+        if self._summary_store.get(deps) is not None:
+            return deps
+
+        request_id = _scheduled_request_id(schedule, delivery_at)
+        for attempt in range(1, self._prepare_attempts + 1):
+            with logfire.span(
+                    "summary.prepare {athlete_id}",
+                    athlete_id=schedule.athlete_id,
+                    attempt=attempt,
+            ):
+                summary_output, _ = await generate_summary(self._agent, deps, request_id)
+            if summary_output is not None:
+                self._summary_store.put(deps, summary_output)
+                return deps
+            if attempt < self._prepare_attempts:
+                LOGGER.warning("summary.prepare_retry request_id=%s attempt=%d", request_id, attempt)
+                await _sleep_until(min(datetime.now(timezone.utc) + self._retry_delay, delivery_at))
+
+        LOGGER.error("summary.prepare_failed request_id=%s attempts=%d", request_id, self._prepare_attempts)
+        return deps
+
+    async def deliver(self, schedule: SummarySchedule, deps: Summary, delivery_at: datetime) -> None:
+        request_id = _scheduled_request_id(schedule, delivery_at)
+        summary_output = self._summary_store.get(deps)
+        if summary_output is None:
+            LOGGER.warning("summary.not_precomputed request_id=%s", request_id)
+            summary_output, _ = await generate_summary(self._agent, deps, request_id)
+            if summary_output is None:
+                _log_skipped_delivery(request_id, "summary generation failed")
+                return
+            self._summary_store.put(deps, summary_output)
+
+        if not schedule.send_signal:
+            return
+        if self._signal_sender is None:
+            LOGGER.error("signal.not_configured request_id=%s", request_id)
+            logfire.error("signal.not_configured")
+            _log_skipped_delivery(request_id, "Signal API is not configured")
+            return
+
+        recipients = tuple(schedule.recipients or self._signal_sender.recipients)
+        with logfire.span("signal.send"):
+            results = await self._signal_sender.send_many([SignalMessage(summary_output, recipients)])
+        failed = [result for result in results if result.error is not None]
+        for result in failed:
+            LOGGER.error(
+                "signal.failed request_id=%s recipient=%s error=%s",
+                request_id,
+                result.recipient,
+                result.error,
+            )
+        if failed:
+            logfire.error("signal.failed")
+        if len(failed) == len(results):
+            _log_skipped_delivery(request_id, "Signal delivery failed")
+            return
+        LOGGER.info(
+            "signal.sent request_id=%s delivered=%d failed=%d",
+            request_id,
+            len(results) - len(failed),
+            len(failed),
+        )
+
+    async def _run_schedule(self, schedule: SummarySchedule) -> None:
+        last_delivery = datetime.now(timezone.utc)
+        _warn_if_delivery_missed(schedule, last_delivery)
+        while True:
+            delivery_at = _next_delivery(schedule, max(datetime.now(timezone.utc), last_delivery))
+            LOGGER.info(
+                "summary.scheduled athlete_id=%s delivery_at=%s",
+                schedule.athlete_id,
+                delivery_at.isoformat(),
+            )
+            try:
+                await _sleep_until(_prepare_at(schedule, delivery_at))
+                deps = await self.prepare(schedule, delivery_at)
+                await _sleep_until(delivery_at)
+                await self.deliver(schedule, deps, delivery_at)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                LOGGER.exception("summary.schedule_failed athlete_id=%s", schedule.athlete_id)
+                logfire.exception("summary.schedule_failed")
+                _log_skipped_delivery(_scheduled_request_id(schedule, delivery_at), "schedule run failed")
+            last_delivery = delivery_at
@@ -1,11 +1,31 @@
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Any
 
-from pydantic_ai import Agent
+from pydantic_ai import Agent, AgentRunResultEvent
 from pydantic_ai.mcp import MCPServerStreamableHTTP
 
 from config import Config
+from prompt_cache import prompt_cache_settings, record_cache_usage
+
+if TYPE_CHECKING:
+    from pydantic_ai import (
+        AbstractToolset,
+        AgentStreamEvent,
+        DeferredToolResults,
+        ModelMessage,
+        ModelSettings,
+        RunUsage,
+        UsageLimits,
+        UserContent,
+    )
+    from pydantic_ai.agent import AgentMetadata, Instructions
+    from pydantic_ai.builtin_tools import AbstractBuiltinTool
+    from pydantic_ai.models import Model
+    from pydantic_ai.output import OutputSpec
+    from pydantic_ai.tools import BuiltinToolFunc
 
 BASE_INSTRUCTIONS = (
     "You are a training assistant. You can access the user's training data through MCP tools. "
@@ -15,10 +35,70 @@ BASE_INSTRUCTIONS = (
 )
 
 
+class ChatAgent(Agent[None, str]):
+    """Agent that records prompt cache usage of runs streamed to the web chat UI.
+
+    ``to_web()`` runs the agent through ``run_stream_events`` with its own event handler, so the
+    usage is taken from the final result event of that stream.
+    """
+
+    def run_stream_events(
+        self,
+        user_prompt: str | Sequence[UserContent] | None = None,
+        *,
+        output_type: OutputSpec[Any] | None = None,
+        message_history: Sequence[ModelMessage] | None = None,
+        deferred_tool_results: DeferredToolResults | None = None,
+        model: Model | str | None = None,
+        instructions: Instructions[None] = None,
+        deps: None = None,
+        model_settings: ModelSettings | None = None,
+        usage_limits: UsageLimits | None = None,
+        usage: RunUsage | None = None,
+        metadata: AgentMetadata[None] | None = None,
+        infer_name: bool = True,
+        toolsets: Sequence[AbstractToolset[None]] | None = None,
+        builtin_tools: Sequence[AbstractBuiltinTool | BuiltinToolFunc[None]] | None = None,
+    ) -> AsyncIterator[AgentStreamEvent | AgentRunResultEvent[Any]]:
+        # Name inference would pick up this frame's `self`, so the agent is named in create_agent.
+        events = super().run_stream_events(
+            user_prompt,
+            output_type=output_type,
+            message_history=message_history,
+            deferred_tool_results=deferred_tool_results,
+            model=model,
+            instructions=instructions,
+            deps=deps,
+            model_settings=model_settings,
+            usage_limits=usage_limits,
+            usage=usage,
+            metadata=metadata,
+            infer_name=False,
+            toolsets=toolsets,
+            builtin_tools=builtin_tools,
+        )
+        return _record_run_usage(events)
+
+
+async def _record_run_usage(
+        events: AsyncIterator[AgentStreamEvent | AgentRunResultEvent[Any]],
+) -> AsyncIterator[AgentStreamEvent | AgentRunResultEvent[Any]]:
+    async for event in events:
+        if isinstance(event, AgentRunResultEvent):
+            record_cache_usage("chat", event.result.usage())
+        yield event
+
+
 def create_agent(config: Config) -> Agent:
     mcp_server = MCPServerStreamableHTTP(
         config.mcp_server_url,
         headers=config.mcp_headers(),
     )
     base_instructions = os.getenv("BASE_INSTRUCTIONS", BASE_INSTRUCTIONS)
-    return Agent(config.model, instructions=base_instructions, toolsets=[mcp_server])
+    return ChatAgent(
+        config.model,
+        name="training_chat",
+        instructions=base_instructions,
+        toolsets=[mcp_server],
+        model_settings=prompt_cache_settings(config.model, "training-ai-chat", cache_messages=True),
+    )
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-import logfire
-from starlette.applications import Starlette
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-from config import load_config
-from summary_api import create_summary_handler
-from summary_agent import create_summary_agent
-from signal_sender import build_signal_sender
-from training_agent import create_agent
+if TYPE_CHECKING:
+    from starlette.applications import Starlette
 
 
 def create_app() -> Starlette:
+    # Served with `uvicorn --factory web:create_app`. Heavy imports live here so that
+    # importing this module stays cheap.
+    import logfire
+
+    from config import load_config
+    from summary_api import SummaryStore, create_summary_handler
+    from summary_agent import create_summary_agent
+    from summary_scheduler import SummaryScheduler, load_schedules
+    from signal_sender import build_signal_sender
+    from training_agent import create_agent
+
     config = load_config()
+    schedules = load_schedules(config.summary_schedules)
 
     logfire.configure()
     logfire.instrument_pydantic_ai()
@@ -19,14 +28,27 @@ def create_app() -> Starlette:
     agent = create_agent(config)
     summary_agent = create_summary_agent(config)
     signal_sender = build_signal_sender(config)
+    summary_store = SummaryStore()
+    scheduler = SummaryScheduler(summary_agent, schedules, summary_store, signal_sender)
     app = agent.to_web()
     app.add_route(
         "/summary",
-        create_summary_handler(summary_agent, signal_sender),
+        create_summary_handler(summary_agent, signal_sender, summary_store),
         methods=["POST"],
         name="Training Summary",
     )
-    return app
 
+    app_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_: Starlette):
+        async with app_lifespan(app_) as state:
+            scheduler.start()
+            try:
+                yield state
+            finally:
+                await scheduler.stop()
+
+    app.router.lifespan_context = lifespan
+    return app
 
-app = create_app()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pydantic_ai.usage import RunUsage
+
+import prompt_cache
+
+
+def test_prompt_cache_settings_per_provider():
+    openai_settings = prompt_cache.prompt_cache_settings("openai:gpt-5", "key")
+    assert openai_settings == {"openai_prompt_cache_key": "key"}
+
+    anthropic_settings = prompt_cache.prompt_cache_settings(
+        "anthropic:claude-sonnet-4-5", "key", cache_messages=True
+    )
+    assert anthropic_settings["anthropic_cache_instructions"] is True
+    assert anthropic_settings["anthropic_cache_messages"] is True
+
+    assert prompt_cache.prompt_cache_settings("test", "key") is None
+
+
+class StubLogfire:
+    def __init__(self):
+        self.infos = []
+
+    def info(self, message: str, **attributes):
+        self.infos.append((message, attributes))
+
+
+def test_record_cache_usage_returns_ratio(monkeypatch):
+    stub_logfire = StubLogfire()
+    monkeypatch.setattr(prompt_cache, "logfire", stub_logfire)
+
+    assert prompt_cache.record_cache_usage("summary", RunUsage(input_tokens=200, cache_read_tokens=150)) == 0.75
+    assert prompt_cache.record_cache_usage("summary", RunUsage()) is None
+    assert len(stub_logfire.infos) == 1
+    assert stub_logfire.infos[0][1]["cache_read_tokens"] == 150
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from signal_sender import SignalMessage, SignalSendError, SignalSenderHttp
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Mimics signal-cli: delivers to valid recipients and reports the failed ones in a 400."""
+
+    def __init__(
+        self,
+        failing_recipients: set[str] | None = None,
+        status_code: int | None = None,
+        error: str | None = None,
+        fail_only_in_batches: bool = False,
+    ):
+        self.failing_recipients = failing_recipients or set()
+        self.status_code = status_code
+        self.error = error
+        self.fail_only_in_batches = fail_only_in_batches
+        self.payloads = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.payloads.append(payload)
+        if self.status_code is not None:
+            return httpx.Response(self.status_code, json={"error": self.error or "server error"})
+        failed = [recipient for recipient in payload["recipients"] if recipient in self.failing_recipients]
+        if self.fail_only_in_batches and len(payload["recipients"]) == 1:
+            failed = []
+        if failed:
+            errors = "\n".join(f"Failed to send message to {recipient}: Unregistered user" for recipient in failed)
+            return httpx.Response(400, json={"error": errors})
+        return httpx.Response(201, json={"timestamp": len(self.payloads)})
+
+
+class TimeoutTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        raise httpx.ReadTimeout("timed out", request=request)
+
+
+def make_sender(transport: httpx.AsyncBaseTransport, **kwargs) -> SignalSenderHttp:
+    return SignalSenderHttp(
+        "http://signal",
+        "+100",
+        transport=transport,
+        requests_per_second=None,
+        **kwargs,
+    )
+
+
+def test_send_defaults_to_own_number():
+    transport = RecordingTransport()
+    sender = make_sender(transport)
+
+    result = asyncio.run(sender.send("hello"))
+    assert result.timestamp == "1"
+    assert transport.payloads == [{"message": "hello", "number": "+100", "recipients": ["+100"]}]
+
+
+def test_send_many_batches_recipients():
+    transport = RecordingTransport()
+    sender = make_sender(transport, max_recipients_per_request=2)
+    messages = [
+        SignalMessage("team", ("+1", "+2", "+3")),
+        SignalMessage("coach", ("+4",)),
+    ]
+
+    results = asyncio.run(sender.send_many(messages))
+    assert [result.recipient for result in results] == ["+1", "+2", "+3", "+4"]
+    assert all(result.error is None for result in results)
+    assert sorted(len(payload["recipients"]) for payload in transport.payloads) == [1, 1, 2]
+
+
+def test_send_many_retries_only_recipients_reported_as_failed():
+    transport = RecordingTransport(failing_recipients={"+2"})
+    sender = make_sender(transport)
+
+    results = asyncio.run(sender.send_many([SignalMessage("team", ("+1", "+2", "+3", "+23"))]))
+    errors = {result.recipient: result.error for result in results}
+    assert errors == {"+1": None, "+2": "Signal API returned HTTP 400", "+3": None, "+23": None}
+    assert [payload["recipients"] for payload in transport.payloads] == [["+1", "+2", "+3", "+23"], ["+2"]]
+
+
+def test_send_many_fails_whole_batch_when_error_is_not_per_recipient():
+    transport = RecordingTransport(status_code=400, error="Invalid recipient +2: not a valid phone number")
+    sender = make_sender(transport)
+
+    results = asyncio.run(sender.send_many([SignalMessage("team", ("+1", "+2", "+3"))]))
+    assert all(result.error == "Signal API returned HTTP 400" for result in results)
+    assert [payload["recipients"] for payload in transport.payloads] == [["+1", "+2", "+3"]]
+
+
+def test_send_takes_timestamp_from_successful_response():
+    transport = RecordingTransport(failing_recipients={"+2"}, fail_only_in_batches=True)
+    sender = make_sender(transport, recipients=["+1", "+2"])
+
+    result = asyncio.run(sender.send("hello"))
+    assert result.timestamp == "2"
+
+
+def test_send_many_does_not_split_batch_after_server_error():
+    transport = RecordingTransport(status_code=502)
+    sender = make_sender(transport)
+
+    results = asyncio.run(sender.send_many([SignalMessage("team", ("+1", "+2"))]))
+    assert all(result.error == "Signal API returned HTTP 502" for result in results)
+    assert [payload["recipients"] for payload in transport.payloads] == [["+1", "+2"]]
+
+
+def test_send_many_does_not_resend_after_timeout():
+    transport = TimeoutTransport()
+    sender = make_sender(transport)
+
+    results = asyncio.run(sender.send_many([SignalMessage("team", ("+1", "+2"))]))
+    assert all(result.error == "Signal API request failed" for result in results)
+    assert transport.requests == 1
+
+
+def test_send_raises_when_no_recipient_gets_the_message():
+    transport = RecordingTransport(failing_recipients={"+100"})
+    sender = make_sender(transport)
+
+    with pytest.raises(SignalSendError):
+        asyncio.run(sender.send("hello"))
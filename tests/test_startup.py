@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+IMPORT_BUDGET_S = float(os.getenv("STARTUP_IMPORT_BUDGET_S", "0.5"))
+BUILD_BUDGET_S = float(os.getenv("STARTUP_BUILD_BUDGET_S", "3.0"))
+HEAVY_MODULES = ["logfire", "pydantic_ai", "starlette", "httpx"]
+
+IMPORT_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+import cli, web
+elapsed = time.perf_counter() - start
+heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps({{"elapsed_s": elapsed, "heavy": heavy}}))
+"""
+
+# Everything `uvicorn --factory web:create_app` does before it serves the first request.
+BUILD_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import web
+web.create_app()
+print(json.dumps({"elapsed_s": time.perf_counter() - start}))
+"""
+
+
+def _run_script(script: str, cwd: Path, **env_overrides: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env.update(env_overrides)
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        cwd=cwd,
+        env=env,
+        text=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def test_entrypoint_imports_do_not_load_heavy_modules(tmp_path):
+    measurement = _run_script(IMPORT_SCRIPT, tmp_path)
+    assert measurement["heavy"] == []
+
+
+def test_entrypoint_imports_stay_within_budget(tmp_path):
+    # Best of a few runs to keep the check stable on a noisy machine.
+    elapsed = min(_run_script(IMPORT_SCRIPT, tmp_path)["elapsed_s"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_S, f"import took {elapsed:.3f}s, budget {IMPORT_BUDGET_S:.3f}s"
+
+
+def test_app_build_stays_within_budget(tmp_path):
+    env = {
+        "MODEL": "test",
+        "MCP_SERVER_URL": "http://127.0.0.1:1/mcp",
+        "LOGFIRE_SEND_TO_LOGFIRE": "false",
+        "SUMMARY_SCHEDULES": "",
+    }
+    elapsed = min(_run_script(BUILD_SCRIPT, tmp_path, **env)["elapsed_s"] for _ in range(2))
+    assert elapsed < BUILD_BUDGET_S, f"app build took {elapsed:.3f}s, budget {BUILD_BUDGET_S:.3f}s"
+
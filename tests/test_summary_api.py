@@ -6,6 +6,7 @@ from datetime import datetime as real_datetime
 
 import pytest
 from pydantic import ValidationError
+from pydantic_ai.usage import RunUsage
 from starlette.requests import Request
 
 import summary_api
@@ -22,6 +23,9 @@ class StubResult:
     def __init__(self, output: str):
         self.output = output
 
+    def usage(self) -> RunUsage:
+        return RunUsage(input_tokens=100, cache_read_tokens=80)
+
 
 class StubAgent:
     def __init__(self, output: str):
@@ -126,7 +130,11 @@ def test_summary_handler_returns_ranges(monkeypatch):
     assert body["activity_range"] == {"start": "2025-03-09", "end": "2025-03-09"}
     assert body["fitness_range"] == {"start": "2025-03-03", "end": "2025-03-09"}
     assert "summary" in body
-    assert agent.last_message == summary_api.DEFAULT_USER_MESSAGE
+    assert agent.last_message.startswith(summary_api.DEFAULT_USER_MESSAGE)
+    assert agent.last_message.endswith(
+        "Use activity data from date 2025-03-09 to 2025-03-09. "
+        "Use fitness data from 2025-03-03 to 2025-03-09."
+    )
     assert agent.last_deps.activity_start_date == "2025-03-09"
     assert agent.last_deps.activity_end_date == "2025-03-09"
     assert agent.last_deps.fitness_start_date == "2025-03-03"
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+import json
+from zoneinfo import ZoneInfo
+
+import pytest
+from pydantic_ai.usage import RunUsage
+from starlette.requests import Request
+
+import summary_api
+import summary_scheduler
+from signal_sender import SignalRecipientResult, SignalSendResult
+
+
+class StubResult:
+    def __init__(self, output: str):
+        self.output = output
+
+    def usage(self) -> RunUsage:
+        return RunUsage(input_tokens=100, cache_read_tokens=80)
+
+
+class StubAgent:
+    def __init__(self, output: str):
+        self.output = output
+        self.calls = 0
+        self.prompts = []
+
+    async def run(self, user_prompt: str, *, deps):
+        self.calls += 1
+        self.prompts.append(user_prompt)
+        return StubResult(f"{self.output} for {deps.athlete_id}")
+
+
+class FlakyAgent(StubAgent):
+    def __init__(self, output: str, failures: int):
+        super().__init__(output)
+        self.failures = failures
+
+    async def run(self, user_prompt: str, *, deps):
+        if self.failures:
+            self.failures -= 1
+            self.calls += 1
+            raise RuntimeError("model unavailable")
+        return await super().run(user_prompt, deps=deps)
+
+
+class StubSignalSender:
+    recipients = ("+100",)
+
+    def __init__(self):
+        self.messages = []
+        self.deliveries = []
+
+    async def send(self, message: str) -> SignalSendResult:
+        self.messages.append(message)
+        return SignalSendResult(timestamp="abc123")
+
+    async def send_many(self, messages) -> list[SignalRecipientResult]:
+        results = []
+        for signal_message in messages:
+            self.messages.append(signal_message.message)
+            for recipient in signal_message.recipients:
+                self.deliveries.append((recipient, signal_message.message))
+                results.append(SignalRecipientResult(recipient, timestamp="abc123"))
+        return results
+
+
+def make_schedule(**overrides) -> summary_scheduler.SummarySchedule:
+    values = {
+        "athlete_id": "i100",
+        "timezone": "Europe/Helsinki",
+        "delivery_time": "07:00",
+        "prepare_minutes": 90,
+        "activity_days": 1,
+        "fitness_days": 7,
+        "send_signal": True,
+    }
+    values.update(overrides)
+    return summary_scheduler.SummarySchedule.model_validate(values)
+
+
+def test_load_schedules_parses_json():
+    raw = json.dumps([make_schedule().model_dump(mode="json")])
+
+    schedules = summary_scheduler.load_schedules(raw)
+    assert len(schedules) == 1
+    assert schedules[0].delivery_time == time(7, 0)
+    assert summary_scheduler.load_schedules(None) == []
+
+
+def test_load_schedules_rejects_invalid_timezone():
+    raw = json.dumps([make_schedule().model_dump(mode="json") | {"timezone": "Not/AZone"}])
+
+    with pytest.raises(RuntimeError):
+        summary_scheduler.load_schedules(raw)
+
+
+def test_next_delivery_rolls_over_to_next_day():
+    schedule = make_schedule()
+    tz = ZoneInfo("Europe/Helsinki")
+
+    before = summary_scheduler._next_delivery(schedule, datetime(2025, 3, 10, 5, 0, tzinfo=tz))
+    assert before == datetime(2025, 3, 10, 7, 0, tzinfo=tz)
+
+    at = summary_scheduler._next_delivery(schedule, datetime(2025, 3, 10, 7, 0, tzinfo=tz))
+    assert at == datetime(2025, 3, 11, 7, 0, tzinfo=tz)
+
+
+def test_prepare_stores_summary_and_deliver_sends_it():
+    agent = StubAgent("stub summary")
+    sender = StubSignalSender()
+    store = summary_api.SummaryStore()
+    schedule = make_schedule()
+    scheduler = summary_scheduler.SummaryScheduler(agent, [schedule], store, sender)
+    delivery_at = datetime(2025, 3, 10, 7, 0, tzinfo=ZoneInfo("Europe/Helsinki"))
+
+    async def run():
+        deps = await scheduler.prepare(schedule, delivery_at)
+        await scheduler.deliver(schedule, deps, delivery_at)
+        return deps
+
+    deps = asyncio.run(run())
+    assert deps.activity_start_date == "2025-03-09"
+    assert deps.fitness_start_date == "2025-03-03"
+    assert deps.athlete_id == "i100"
+    assert store.get(deps) == "stub summary for i100"
+    assert sender.deliveries == [("+100", "stub summary for i100")]
+    assert agent.calls == 1
+    assert agent.prompts[0].endswith("Use athlete ID i100 in all data requests.")
+
+
+def test_prepare_at_subtracts_in_utc_across_dst_change():
+    schedule = make_schedule(prepare_minutes=300)
+    # Clocks in Helsinki go from 03:00 to 04:00 on 2025-03-30.
+    delivery_at = datetime(2025, 3, 30, 7, 0, tzinfo=ZoneInfo("Europe/Helsinki"))
+
+    prepare_at = summary_scheduler._prepare_at(schedule, delivery_at)
+    assert delivery_at - prepare_at == timedelta(minutes=300)
+    assert prepare_at == datetime(2025, 3, 29, 23, 0, tzinfo=timezone.utc)
+
+
+def test_prepare_retries_failed_build():
+    agent = FlakyAgent("stub summary", failures=2)
+    store = summary_api.SummaryStore()
+    schedule = make_schedule()
+    scheduler = summary_scheduler.SummaryScheduler(agent, [schedule], store, StubSignalSender())
+    delivery_at = datetime(2025, 3, 10, 7, 0, tzinfo=ZoneInfo("Europe/Helsinki"))
+
+    deps = asyncio.run(scheduler.prepare(schedule, delivery_at))
+    assert agent.calls == 3
+    assert store.get(deps) == "stub summary for i100"
+
+
+def test_deliver_logs_skipped_delivery(caplog):
+    agent = FlakyAgent("stub summary", failures=4)
+    sender = StubSignalSender()
+    store = summary_api.SummaryStore()
+    schedule = make_schedule()
+    scheduler = summary_scheduler.SummaryScheduler(agent, [schedule], store, sender)
+    delivery_at = datetime(2025, 3, 10, 7, 0, tzinfo=ZoneInfo("Europe/Helsinki"))
+
+    async def run():
+        deps = await scheduler.prepare(schedule, delivery_at)
+        await scheduler.deliver(schedule, deps, delivery_at)
+
+    asyncio.run(run())
+    assert agent.calls == 4
+    assert sender.deliveries == []
+    assert "summary.delivery_skipped request_id=scheduled-i100-2025-03-10" in caplog.text
+
+
+def test_warns_about_delivery_possibly_missed_during_restart(caplog):
+    schedule = make_schedule()
+    tz = ZoneInfo("Europe/Helsinki")
+
+    summary_scheduler._warn_if_delivery_missed(schedule, datetime(2025, 3, 10, 7, 20, tzinfo=tz))
+    assert "summary.delivery_possibly_missed request_id=scheduled-i100-2025-03-10" in caplog.text
+
+    caplog.clear()
+    summary_scheduler._warn_if_delivery_missed(schedule, datetime(2025, 3, 10, 9, 0, tzinfo=tz))
+    assert "delivery_possibly_missed" not in caplog.text
+
+
+def test_prepare_keeps_athletes_with_same_ranges_apart():
+    agent = StubAgent("stub summary")
+    sender = StubSignalSender()
+    store = summary_api.SummaryStore()
+    first = make_schedule(athlete_id="i100")
+    second = make_schedule(athlete_id="i200")
+    scheduler = summary_scheduler.SummaryScheduler(agent, [first, second], store, sender)
+    delivery_at = datetime(2025, 3, 10, 7, 0, tzinfo=ZoneInfo("Europe/Helsinki"))
+
+    async def run():
+        for schedule in (first, second):
+            deps = await scheduler.prepare(schedule, delivery_at)
+            await scheduler.deliver(schedule, deps, delivery_at)
+
+    asyncio.run(run())
+    assert agent.calls == 2
+    assert sender.messages == ["stub summary for i100", "stub summary for i200"]
+
+
+def test_deliver_sends_each_athlete_to_own_recipients():
+    agent = StubAgent("stub summary")
+    sender = StubSignalSender()
+    store = summary_api.SummaryStore()
+    first = make_schedule(athlete_id="i100", recipients=["+1", "+coach"])
+    second = make_schedule(athlete_id="i200", recipients=["+2"])
+    scheduler = summary_scheduler.SummaryScheduler(agent, [first, second], store, sender)
+    delivery_at = datetime(2025, 3, 10, 7, 0, tzinfo=ZoneInfo("Europe/Helsinki"))
+
+    async def run():
+        for schedule in (first, second):
+            deps = await scheduler.prepare(schedule, delivery_at)
+            await scheduler.deliver(schedule, deps, delivery_at)
+
+    asyncio.run(run())
+    assert sender.deliveries == [
+        ("+1", "stub summary for i100"),
+        ("+coach", "stub summary for i100"),
+        ("+2", "stub summary for i200"),
+    ]
+
+
+class FixedDateTime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2025, 3, 10, 12, 0, tzinfo=tz)
+
+
+def make_request(payload: dict) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": json.dumps(payload).encode("utf-8"), "more_body": False}
+
+    return Request({"type": "http", "method": "POST", "path": "/summary", "headers": []}, receive)
+
+
+def summary_payload(**overrides) -> dict:
+    payload = {"activity_days": 1, "fitness_days": 7, "timezone": "Europe/Helsinki", "athlete_id": "i100"}
+    payload.update(overrides)
+    return payload
+
+
+def test_summary_handler_reuses_stored_summary(monkeypatch):
+    monkeypatch.setattr(summary_api, "datetime", FixedDateTime)
+    agent = StubAgent("fresh summary")
+    store = summary_api.SummaryStore()
+    _, _, deps = summary_api.build_summary_deps(make_schedule(send_signal=False))
+    store.put(deps, "precomputed summary")
+    handler = summary_api.create_summary_handler(agent, summary_store=store)
+
+    response = asyncio.run(handler(make_request(summary_payload())))
+    assert response.status_code == 200
+    assert json.loads(response.body.decode("utf-8"))["summary"] == "precomputed summary"
+    assert agent.calls == 0
+
+
+def test_summary_handler_refresh_bypasses_store_and_does_not_cache(monkeypatch):
+    monkeypatch.setattr(summary_api, "datetime", FixedDateTime)
+    agent = StubAgent("fresh summary")
+    store = summary_api.SummaryStore()
+    _, _, deps = summary_api.build_summary_deps(make_schedule(send_signal=False))
+    store.put(deps, "precomputed summary")
+    handler = summary_api.create_summary_handler(agent, summary_store=store)
+
+    response = asyncio.run(handler(make_request(summary_payload(refresh=True))))
+    assert json.loads(response.body.decode("utf-8"))["summary"] == "fresh summary for i100"
+    assert store.get(deps) == "precomputed summary"
+
+    other = summary_payload(athlete_id="i200")
+    asyncio.run(handler(make_request(other)))
+    asyncio.run(handler(make_request(other)))
+    assert agent.calls == 3
+
+
+def test_summary_store_expires_entries():
+    store = summary_api.SummaryStore(max_age=timedelta(0))
+    _, _, deps = summary_api.build_summary_deps(make_schedule())
+    store.put(deps, "stale summary")
+
+    assert store.get(deps) is None
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import asyncio
+
+import training_agent
+
+
+def test_chat_agent_records_cache_usage_of_streamed_runs(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(training_agent, "record_cache_usage", lambda name, usage: recorded.append((name, usage)))
+    agent = training_agent.ChatAgent("test")
+
+    async def run():
+        return [event async for event in agent.run_stream_events("hello")]
+
+    events = asyncio.run(run())
+    assert len(recorded) == 1
+    name, usage = recorded[0]
+    assert name == "chat"
+    assert usage == events[-1].result.usage()